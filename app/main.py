@@ -1,101 +1,333 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import logging
+import threading
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+import msgspec
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 
 from config import settings, get_logger
 
 logger = get_logger(__name__)
 
+# Settings are immutable after startup; resolving them (and the enum
+# .value hop) once here keeps repeated reads out of request handling.
+_APP_NAME = settings.app_name
+_APP_VERSION = settings.app_version
+_ENV_VALUE = settings.environment
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse backed by orjson for faster dict serialization."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=msgspec.to_builtins)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Log application startup."""
+    logger.info(
+        f"Starting {_APP_NAME} v{_APP_VERSION} in {_ENV_VALUE} environment"
+    )
+    yield
+
+
 app = FastAPI(
-    title=settings.app_name,
-    version=settings.app_version,
-    description="A production-ready task management API with GitOps support"
+    title=_APP_NAME,
+    version=_APP_VERSION,
+    description="A production-ready task management API with GitOps support",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-tasks = {}
+# The root and health payloads never change after startup, and they are
+# the two endpoints Kubernetes probes hammer — encode them once at import
+# and serve the raw bytes.
+_ROOT_BODY = orjson.dumps({
+    "message": f"{_APP_NAME} is running",
+    "version": _APP_VERSION,
+    "environment": _ENV_VALUE
+})
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "environment": _ENV_VALUE
+})
+
+# Constant error responses, built once. Raising HTTPException allocates
+# an exception, unwinds into FastAPI's handler, and re-encodes the same
+# JSON body every time — returning a prebuilt Response skips all of it.
+_NOT_FOUND = Response(
+    content=b'{"detail":"Task not found"}',
+    status_code=404,
+    media_type="application/json"
+)
+_ALREADY_EXISTS = Response(
+    content=b'{"detail":"Task already exists"}',
+    status_code=409,
+    media_type="application/json"
+)
+
+# Task storage: sharded by task id so concurrent mutations contend only
+# on their own partition's lock. Each shard keeps the compact layout from
+# before — a dense list plus an id -> position index — so per-entry
+# overhead stays low and full-collection reads scan contiguous memory.
+# Deletion uses swap-remove within the shard to stay O(1).
+_NUM_SHARDS = 16  # power of two so the shard pick is a single mask
+
+
+class _Shard:
+    """One lockable partition of the task store."""
+
+    __slots__ = ("tasks", "index", "lock")
+
+    def __init__(self):
+        self.tasks = []
+        self.index = {}
+        self.lock = threading.Lock()
+
+
+_shards = [_Shard() for _ in range(_NUM_SHARDS)]
+
+
+def _shard_for(task_id: int) -> _Shard:
+    return _shards[task_id & (_NUM_SHARDS - 1)]
 
 
-class Task(BaseModel):
-    """Task model for request/response bodies."""
+# Serialized snapshot of the full task collection. Rebuilt lazily on the
+# first GET after a mutation, so read-heavy workloads pay the O(N) encode
+# cost once instead of on every request.
+_tasks_cache_bytes = None
+
+# Monotonic revision of the task collection, bumped on every mutation.
+# Doubles as a cheap ETag source: comparing an integer beats hashing
+# response bodies, and unchanged-state polls can be answered with a 304.
+_tasks_rev = 0
+
+# Guards _tasks_rev and _tasks_cache_bytes. Shard locks only serialize
+# mutations within one partition, so the cross-shard read-modify-write on
+# the revision counter needs its own lock — losing an increment would let
+# a stale ETag keep matching after the data changed. Mutators acquire it
+# while holding their shard lock (always shard -> rev, never the reverse,
+# so the ordering cannot deadlock).
+_rev_lock = threading.Lock()
+
+
+class Task(msgspec.Struct, frozen=True, gc=False):
+    """Task model for request/response bodies.
+
+    Structs are slotted (no per-instance ``__dict__``), frozen records are
+    replaced wholesale on update, and ``gc=False`` skips cycle tracking
+    since the fields cannot form reference cycles — all of which keeps a
+    large task store compact and cache-friendly.
+    """
     id: int
     title: str
     completed: bool = False
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Log application startup."""
-    logger.info(
-        f"Starting {settings.app_name} v{settings.app_version} "
-        f"in {settings.environment.value} environment"
+# Decoder/encoder are built once at import so per-request decoding is a
+# single C call instead of repeated Pydantic model construction.
+_task_decoder = msgspec.json.Decoder(Task)
+_task_encoder = msgspec.json.Encoder()
+
+
+def _decode_task(body: bytes) -> Task:
+    """Decode a request body into a Task, mapping decode errors to 422."""
+    try:
+        return _task_decoder.decode(body)
+    except msgspec.ValidationError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    except msgspec.DecodeError:
+        raise HTTPException(status_code=422, detail="Invalid JSON body")
+
+
+def _invalidate_tasks_cache() -> None:
+    """Drop the serialized /tasks snapshot and bump the revision."""
+    global _tasks_cache_bytes, _tasks_rev
+    with _rev_lock:
+        _tasks_cache_bytes = None
+        _tasks_rev += 1
+
+
+def _etag_or_304(request: Request, rev: int):
+    """Return the ETag for rev, or a ready 304 response on a match.
+
+    Callers capture the revision once and thread it through, so the ETag
+    they advertise and the body they serve describe the same revision.
+    """
+    etag = f'W/"{rev}"'
+    if request.headers.get("if-none-match") == etag:
+        return etag, Response(status_code=304, headers={"ETag": etag})
+    return etag, None
+
+
+@lru_cache(maxsize=1024)
+def _encoded_task(task_id: int, rev: int) -> bytes:
+    """Encode a stored task once per (id, revision) pair.
+
+    Mutations bump the revision, so stale entries are never served; the
+    LRU bound keeps memory in check while hot tasks are re-encoded only
+    after the store actually changes.
+
+    Raises KeyError if the task vanished since the caller's existence
+    check — the shard lock makes the index read and list access atomic
+    against a concurrent swap-remove, but cannot resurrect the entry.
+    """
+    shard = _shard_for(task_id)
+    with shard.lock:
+        return _task_encoder.encode(shard.tasks[shard.index[task_id]])
+
+
+def _task_response(task: Task, headers: dict | None = None) -> Response:
+    """Serialize a Task directly with msgspec, skipping jsonable_encoder."""
+    return Response(
+        content=_task_encoder.encode(task),
+        media_type="application/json",
+        headers=headers
     )
 
 
 @app.get("/")
 def root():
     """Root endpoint returns API status and version."""
-    logger.debug("GET / called")
-    return {
-        "message": f"{settings.app_name} is running",
-        "version": settings.app_version,
-        "environment": settings.environment.value
-    }
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("GET / called")
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 def health():
     """Health check endpoint for Kubernetes probes."""
-    logger.debug("Health check called")
-    return {"status": "healthy", "environment": settings.environment.value}
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Health check called")
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@app.get("/tasks")
-def get_tasks():
+@app.get("/tasks", response_model=None)
+def get_tasks(request: Request):
     """Retrieve all tasks."""
-    logger.debug(f"GET /tasks - returning {len(tasks)} tasks")
-    return tasks
+    global _tasks_cache_bytes
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "GET /tasks - returning %d tasks",
+            sum(len(shard.tasks) for shard in _shards)
+        )
+    rev = _tasks_rev
+    etag, not_modified = _etag_or_304(request, rev)
+    if not_modified is not None:
+        return not_modified
+    content = _tasks_cache_bytes
+    if content is None:
+        # Snapshot each shard under its lock so a concurrent swap-remove
+        # or append cannot yield missing or duplicated tasks.
+        snapshot = {}
+        for shard in _shards:
+            with shard.lock:
+                for task in shard.tasks:
+                    snapshot[task.id] = task
+        content = _task_encoder.encode(snapshot)
+        with _rev_lock:
+            # Publish only if no mutation landed while encoding —
+            # caching bytes for a superseded revision would serve a
+            # stale body (confirmed by 304s) until the next mutation.
+            if _tasks_rev == rev:
+                _tasks_cache_bytes = content
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
-@app.get("/tasks/{task_id}")
-def get_task(task_id: int):
+@app.get("/tasks/{task_id}", response_model=None)
+def get_task(task_id: int, request: Request):
     """Retrieve a single task by ID."""
-    logger.debug(f"GET /tasks/{task_id}")
-    if task_id not in tasks:
-        logger.warning(f"Task {task_id} not found")
-        raise HTTPException(status_code=404, detail="Task not found")
-    return tasks[task_id]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("GET /tasks/%d", task_id)
+    if task_id not in _shard_for(task_id).index:
+        logger.warning("Task %d not found", task_id)
+        return _NOT_FOUND
+    rev = _tasks_rev
+    etag, not_modified = _etag_or_304(request, rev)
+    if not_modified is not None:
+        return not_modified
+    try:
+        content = _encoded_task(task_id, rev)
+    except (KeyError, IndexError):
+        # A concurrent delete won the race since the existence check
+        # (IndexError guards against a stale index position the same way).
+        logger.warning("Task %d not found", task_id)
+        return _NOT_FOUND
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
 @app.post("/tasks")
-def create_task(task: Task):
+async def create_task(request: Request):
     """Create a new task."""
-    logger.info(f"Creating task {task.id}: {task.title}")
-    if task.id in tasks:
-        logger.warning(f"Task {task.id} already exists")
-        raise HTTPException(status_code=409, detail="Task already exists")
-    tasks[task.id] = task
-    logger.info(f"Task {task.id} created successfully")
-    return task
+    task = _decode_task(await request.body())
+    logger.info("Creating task %d: %s", task.id, task.title)
+    shard = _shard_for(task.id)
+    with shard.lock:
+        if task.id in shard.index:
+            logger.warning("Task %d already exists", task.id)
+            return _ALREADY_EXISTS
+        shard.index[task.id] = len(shard.tasks)
+        shard.tasks.append(task)
+        _invalidate_tasks_cache()
+    logger.info("Task %d created successfully", task.id)
+    return _task_response(task)
 
 
 @app.put("/tasks/{task_id}")
-def update_task(task_id: int, task: Task):
+async def update_task(task_id: int, request: Request):
     """Update an existing task."""
-    logger.info(f"Updating task {task_id}")
-    if task_id not in tasks:
-        logger.warning(f"Task {task_id} not found for update")
-        raise HTTPException(status_code=404, detail="Task not found")
-    tasks[task_id] = task
-    logger.info(f"Task {task_id} updated successfully")
-    return task
+    task = _decode_task(await request.body())
+    if task.id != task_id:
+        # Swap-remove relies on every stored task's id matching its index
+        # key; storing a body with a different id would leave a dangling
+        # index entry behind the next delete.
+        logger.warning(
+            "Task id %d in body does not match path id %d", task.id, task_id
+        )
+        raise HTTPException(
+            status_code=422,
+            detail="Task id in body does not match path id"
+        )
+    logger.info("Updating task %d", task_id)
+    shard = _shard_for(task_id)
+    with shard.lock:
+        idx = shard.index.get(task_id)
+        if idx is None:
+            logger.warning("Task %d not found for update", task_id)
+            return _NOT_FOUND
+        shard.tasks[idx] = task
+        _invalidate_tasks_cache()
+    logger.info("Task %d updated successfully", task_id)
+    return _task_response(task)
 
 
 @app.delete("/tasks/{task_id}")
 def delete_task(task_id: int):
     """Delete a task by ID."""
-    logger.info(f"Deleting task {task_id}")
-    if task_id not in tasks:
-        logger.warning(f"Task {task_id} not found for deletion")
-        raise HTTPException(status_code=404, detail="Task not found")
-    del tasks[task_id]
-    logger.info(f"Task {task_id} deleted successfully")
+    logger.info("Deleting task %d", task_id)
+    shard = _shard_for(task_id)
+    with shard.lock:
+        idx = shard.index.pop(task_id, None)
+        if idx is None:
+            logger.warning("Task %d not found for deletion", task_id)
+            return _NOT_FOUND
+        last = shard.tasks.pop()
+        if idx < len(shard.tasks):
+            # Swap-remove: move the former tail into the freed slot.
+            shard.tasks[idx] = last
+            shard.index[last.id] = idx
+        _invalidate_tasks_cache()
+    logger.info("Task %d deleted successfully", task_id)
     return {"message": "Task deleted"}
\ No newline at end of file
@@ -4,20 +4,31 @@ Pytest configuration and fixtures for Task API tests.
 
 import pytest
 from fastapi.testclient import TestClient
+from app import main
 from app.main import app
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def client():
     """
-    Provide a test client for API requests.
-    Resets app state before each test.
+    Provide a shared test client for API requests.
+
+    Module scope avoids rebuilding the ASGI transport per test; state is
+    reset separately by the autouse fixture below.
     """
-    # Clear tasks before each test
-    app.tasks = {}
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def _reset_state():
+    """Clear the task store (and its serialization cache) before each test."""
+    for shard in main._shards:
+        shard.tasks.clear()
+        shard.index.clear()
+    main._invalidate_tasks_cache()
+    yield
+
+
 @pytest.fixture
 def sample_task():
     """Provide a sample task for testing."""
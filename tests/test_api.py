@@ -54,6 +54,49 @@ class TestTaskCreation:
         assert "already exists" in response2.json()["detail"]
 
 
+class TestTaskValidation:
+    """Tests for request body validation on the write endpoints.
+
+    Bodies are decoded strictly by msgspec: wrong-type fields are
+    rejected rather than coerced, and errors surface as a 422 with a
+    string detail message.
+    """
+
+    def test_create_task_invalid_json(self, client):
+        """Test creating a task from a malformed body returns 422."""
+        response = client.post(
+            "/tasks",
+            content=b"not json",
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 422
+        assert isinstance(response.json()["detail"], str)
+
+    def test_create_task_wrong_type_field(self, client):
+        """Test a wrong-type field is rejected, not coerced."""
+        response = client.post(
+            "/tasks", json={"id": "1", "title": "Stringly-typed id"}
+        )
+        assert response.status_code == 422
+        assert "id" in response.json()["detail"]
+
+    def test_create_task_missing_required_field(self, client):
+        """Test a missing required field returns 422."""
+        response = client.post("/tasks", json={"id": 1})
+        assert response.status_code == 422
+        assert "title" in response.json()["detail"]
+
+    def test_update_task_invalid_body(self, client, sample_task):
+        """Test updating with a malformed body returns 422."""
+        client.post("/tasks", json=sample_task)
+        response = client.put(
+            f"/tasks/{sample_task['id']}",
+            content=b"{",
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 422
+
+
 class TestTaskRetrieval:
     """Tests for retrieving tasks."""
 
@@ -117,6 +160,22 @@ class TestTaskUpdate:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]
 
+    def test_update_task_mismatched_id(self, client, sample_task):
+        """Test a body id differing from the path id returns 422."""
+        client.post("/tasks", json=sample_task)
+
+        mismatched = {"id": 33, "title": "Smuggled id", "completed": False}
+        response = client.put(f"/tasks/{sample_task['id']}", json=mismatched)
+        assert response.status_code == 422
+        assert "does not match" in response.json()["detail"]
+
+        # The store is untouched: the original task survives and no task
+        # appeared under the smuggled id.
+        unchanged = client.get(f"/tasks/{sample_task['id']}")
+        assert unchanged.status_code == 200
+        assert unchanged.json()["title"] == sample_task["title"]
+        assert client.get("/tasks/33").status_code == 404
+
 
 class TestTaskDeletion:
     """Tests for deleting tasks."""
@@ -142,6 +201,80 @@ class TestTaskDeletion:
         assert "not found" in response.json()["detail"]
 
 
+class TestConditionalGet:
+    """Tests for ETag emission and 304 short-circuiting on the GET endpoints."""
+
+    def test_get_all_tasks_has_etag(self, client, sample_task):
+        """Test GET /tasks carries an ETag header."""
+        client.post("/tasks", json=sample_task)
+        response = client.get("/tasks")
+        assert response.status_code == 200
+        assert "etag" in response.headers
+
+    def test_get_single_task_has_etag(self, client, sample_task):
+        """Test GET /tasks/{id} carries an ETag header."""
+        client.post("/tasks", json=sample_task)
+        response = client.get(f"/tasks/{sample_task['id']}")
+        assert response.status_code == 200
+        assert "etag" in response.headers
+
+    def test_matching_if_none_match_returns_304(self, client, sample_task):
+        """Test a revisit with the current ETag gets an empty 304."""
+        client.post("/tasks", json=sample_task)
+        first = client.get("/tasks")
+
+        revisit = client.get(
+            "/tasks", headers={"If-None-Match": first.headers["etag"]}
+        )
+        assert revisit.status_code == 304
+        assert revisit.content == b""
+        assert revisit.headers["etag"] == first.headers["etag"]
+
+    def test_mutation_invalidates_etag(self, client, sample_task):
+        """Test a stale ETag gets a fresh 200 body after any mutation."""
+        client.post("/tasks", json=sample_task)
+        stale = client.get("/tasks").headers["etag"]
+
+        # Each mutation bumps the revision, so the old ETag stops matching.
+        updated = {"id": sample_task["id"], "title": "Updated", "completed": True}
+        client.put(f"/tasks/{sample_task['id']}", json=updated)
+        response = client.get("/tasks", headers={"If-None-Match": stale})
+        assert response.status_code == 200
+        assert response.headers["etag"] != stale
+        assert response.json()[str(sample_task["id"])]["completed"] is True
+
+        stale = response.headers["etag"]
+        client.post("/tasks", json={"id": 99, "title": "Another"})
+        response = client.get("/tasks", headers={"If-None-Match": stale})
+        assert response.status_code == 200
+
+        stale = response.headers["etag"]
+        client.delete("/tasks/99")
+        response = client.get("/tasks", headers={"If-None-Match": stale})
+        assert response.status_code == 200
+        assert "99" not in response.json()
+
+    def test_single_task_304_roundtrip(self, client, sample_task):
+        """Test GET /tasks/{id} honors If-None-Match until the store changes."""
+        client.post("/tasks", json=sample_task)
+        first = client.get(f"/tasks/{sample_task['id']}")
+
+        revisit = client.get(
+            f"/tasks/{sample_task['id']}",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        assert revisit.status_code == 304
+
+        updated = {"id": sample_task["id"], "title": "Changed", "completed": True}
+        client.put(f"/tasks/{sample_task['id']}", json=updated)
+        response = client.get(
+            f"/tasks/{sample_task['id']}",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "Changed"
+
+
 class TestTaskIntegration:
     """Integration tests for task workflow."""
 